@@ -1,7 +1,8 @@
 import os 
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 import csv 
+import shutil
 from send2trash import send2trash
 import argparse
 
@@ -29,26 +30,32 @@ class EntityData:
     to IMPORTANCE_THRESHOLD
     
     Notes:
-    - Deprecations status depends on the current system clock at instantiation time.
+    - Deprecations status is evaluated once, at instantiation, against 
+    EntityData._cutoff computed per run by browse_files.
     - The class assumes TIME_LIMIT_IN_DAYS and IMPORTANCE_THRESHOLD are defined at module level
+    - Instances use __slots__, no per-instance __dict__ is allocated
     """
+    __slots__ = ("path", "birthdate", "last_access", "importance_level", "_deprecated")
+    
     def __init__(self, path : str, birthdate : float, last_access: float, importance_level : int):
         self.path = str(path)
         self.birthdate = float(birthdate)
         self.last_access = float(last_access)
         self.importance_level = int(importance_level)
+        self._deprecated = self.last_access < EntityData._cutoff
+    
+    # Oldest last_access timestamp still considered in use, set by browse_files
+    _cutoff = 0.0
     
     @property 
     def is_deprecated(self) -> bool:
         # Determine if the entity is deprecated or not
-        dt = datetime.now()
-        dt_plus_limit = datetime.fromtimestamp(self.last_access) + timedelta(days=TIME_LIMIT_IN_DAYS)
-        return dt > dt_plus_limit
+        return self._deprecated
         
     @property 
     def is_important(self) -> bool: 
         # Determine if the entity is important or not 
-        return int(self.importance_level) >= IMPORTANCE_THRESHOLD
+        return self.importance_level >= IMPORTANCE_THRESHOLD
     
     
     
@@ -62,7 +69,7 @@ class Memory:
     Stored attributes:
     - path (str): filesystem path to the CSV file used as persistent storage
     - last_metadata (dict): in-memory representation of the last recorded metadata,
-    indexed by entity path
+    indexed by entity path, as (last_access, importance_level) tuples
     
     Behavior: 
     - Subsequent updates replace the previous persisted state entirely
@@ -80,13 +87,13 @@ class Memory:
         
         self.last_metadata = self.load_last_metadata()
 
-    def load_last_metadata(self) -> dict[str, EntityData]:
+    def load_last_metadata(self) -> dict[str, tuple[float, int]]:
         """
         Load previously recorded metadata from CSV file into memory.
         
-        The function reads the entire CSV file located at self.path, and constructs
-        and EntityData instance for each row, and returns a dictionary indexed by 
-        filesystem path of each entity.
+        The function reads the entire CSV file located at self.path, keeps the
+        fields needed to track access evolution for each row, and returns a 
+        dictionary indexed by filesystem path of each entity.
         
         Precondition:
         - CSV file exists and is readable 
@@ -94,28 +101,25 @@ class Memory:
         - CSV file is UTF-8 encoded
         
         Behavior:
-        - The entire file is read eagerly into memory
+        - Rows are streamed from the file, columns are read by position
+        - An empty file (no header) yields an empty mapping
         - Rows with the same path overwrite previous entries
-        - Type conversion are delegated to the EntityData constructor.
+        - birthdate is not kept, it is re-read from the filesystem on each run
         - No validation is performed
         
     
-        :return: Mapping of entity paths to EntityData instances
+        :return: Mapping of entity paths to (last_access, importance_level) tuples
         :rtype: dict
         """
         
         metadata = dict()
    
         with open(self.path, "r", newline="", encoding="utf-8") as db:
-            reader = csv.DictReader(db)
-            for data in list(reader):
-                
-                path=data["path"]
-                birthdate=data["birthdate"]
-                last_access=data["last_access"]
-                importance_level=data["importance_level"]
-                
-                metadata[path] = EntityData(path, birthdate, last_access, importance_level)
+            reader = csv.reader(db)
+            # Skip headers
+            next(reader, None)
+            for path, _, last_access, importance_level in reader:
+                metadata[path] = (float(last_access), int(importance_level))
  
 
         return metadata
@@ -160,48 +164,48 @@ class Memory:
             # Headers
             writer.writerow(["path", "birthdate", "last_access", "importance_level"])
             
-            # Write each item, line by line 
-            for entity in entities:
-                if not entity.is_deprecated: 
-                    writer.writerow([
-                        entity.path,
-                        entity.birthdate,
-                        entity.last_access,
-                        entity.importance_level
-                    ])
+            # Write every non-deprecated item in a single call
+            writer.writerows(
+                (entity.path, entity.birthdate, entity.last_access, entity.importance_level)
+                for entity in entities
+                if not entity.is_deprecated
+            )
           
         
     
 
         
 
-def extract_data(entity : Path) -> EntityData: 
+def extract_data(entry : os.DirEntry) -> EntityData: 
     """
-    Build an EntityData instance from filesystem metadata of a given path.
+    Build an EntityData instance from filesystem metadata of a given directory entry.
     
-    The function reads filesystem-level metadata from provided and converts
-    them directly into an EntityData object.
+    The function reads filesystem-level metadata from the provided entry and 
+    converts them directly into an EntityData object.
     
     Precondition:
-    - entity exists on the filesystem
-    - entity is accessible for stat operations
+    - entry exists on the filesystem
+    - entry is accessible for stat operations
     
     Metadata extracted:
     - birthdate: filesystem creation time (st_birthtime)
     - last_access: last access time (st_atime) 
     
+    Behavior:
+    - The entry is stat'ed once, both timestamps are read from the same result
+    - Symbolic links are not followed, the link itself is the entity; on Windows
+      the result comes from the directory listing without an extra system call
+    
     Fixed value:
     - importance_level is set to 0 
     
-    :param entity: Filesystem path identifying the target entity
-    :type entity: Path
+    :param entry: Directory entry identifying the target entity
+    :type entry: os.DirEntry
     :return: EntityData instance populated with filesystem metadata
     :rtype: EntityData
     """
-    path = entity
-    birthdate = entity.stat().st_birthtime
-    last_access = entity.stat().st_atime
-    return EntityData(path, birthdate, last_access, importance_level=0)
+    st = entry.stat(follow_symlinks=False)
+    return EntityData(entry.path, st.st_birthtime, st.st_atime, importance_level=0)
 
 def update_data(data: EntityData, db : Memory) -> None:
     """
@@ -224,7 +228,7 @@ def update_data(data: EntityData, db : Memory) -> None:
     - Does not persist changes or modify Memory state
 
     Preconditions:
-    - db.last_metadata contains EntityData instances indexed by path
+    - db.last_metadata contains (last_access, importance_level) tuples indexed by path
     - data.path is a valid key candidate in db.last_metadata
 
     :param data: Current metadata snapshot of the entity
@@ -234,63 +238,70 @@ def update_data(data: EntityData, db : Memory) -> None:
     """
     
     # Check if old metadata exists
-    if db.last_metadata.get(data.path) is None:
+    last_metadata = db.last_metadata.get(data.path)
+    if last_metadata is None:
         return 
     
-    last_metadata = db.last_metadata[data.path]
-    
-    old_last_access = last_metadata.last_access
-    new_last_access = data.last_access
-    data.importance_level = last_metadata.importance_level
+    old_last_access, data.importance_level = last_metadata
 
-    if new_last_access > old_last_access: 
+    if data.last_access > old_last_access: 
         data.importance_level += 1
         
 
-def archive_data(entity: EntityData) -> None:
-    src = Path(entity.path)
-    print(f"[ARCHIVED] {src}")
-    if DRY_RUN_MODE:
+def _deprecation_cutoff(now: datetime) -> float:
+    # Timestamp before which a last access is older than TIME_LIMIT_IN_DAYS
+    return now.timestamp() - TIME_LIMIT_IN_DAYS * 86400
+
+def archive_data(entities: list[EntityData], archive_dir: Path) -> None:
+    for entity in entities:
+        print(f"[ARCHIVED] {entity.path}")
+    if DRY_RUN_MODE or not entities:
         return 
     
-    dst = Path(f"{ARCHIVE_PATH}/{datetime.now()}").joinpath(src.name)
-    src.rename(dst)
+    # Archive directory is created once, only when something is archived
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    for entity in entities:
+        # shutil.move also handles an archive on another drive
+        shutil.move(entity.path, archive_dir.joinpath(os.path.basename(entity.path)))
 
-def delete_data(entity: EntityData) -> None:
-    
-    src = Path(entity.path)
-    print(f"[DELETED] {src}")
-    if DRY_RUN_MODE:
+def delete_data(entities: list[EntityData]) -> None:
+    for entity in entities:
+        print(f"[DELETED] {entity.path}")
+    if DRY_RUN_MODE or not entities:
         return 
     
-    send2trash(src)
+    # A single call sends every entity to the trash in one shell operation
+    send2trash([entity.path for entity in entities])
 
 def browse_files(path : str, db_path): 
     
     entity_checked_count = 0
     entity_cleaned_count = 0
+    now = datetime.now() # Reference time of this run
+    EntityData._cutoff = _deprecation_cutoff(now)
     db = Memory(db_path) # Load CSV file
-    entities = next(os.walk(path)) 
-    dirs = entities[1]
-    files = entities[2]
-    entities = [Path(path).joinpath(e) for e in dirs + files]
     entities_metadata = list()
+    to_archive = list()
+    to_delete = list()
     
-    for entity in entities:
-        entity = extract_data(entity)
-        update_data(entity, db)
-        
-        if entity.is_deprecated:
-            entity_cleaned_count +=1
-            if entity.is_important and SAFE_MODE:
-                archive_data(entity)
-            else:
-                delete_data(entity)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            entity = extract_data(entry)
+            update_data(entity, db)
             
-        
-        entities_metadata.append(entity)
-        entity_checked_count+=1
+            if entity.is_deprecated:
+                entity_cleaned_count +=1
+                if entity.is_important and SAFE_MODE:
+                    to_archive.append(entity)
+                else:
+                    to_delete.append(entity)
+                
+            
+            entities_metadata.append(entity)
+            entity_checked_count+=1
     
+    delete_data(to_delete)
+    archive_data(to_archive, Path(ARCHIVE_PATH).joinpath(now.strftime("%Y%m%d_%H%M%S")))
     db.update(entities_metadata)
     print(
     f"""